@@ -1,9 +1,15 @@
 from fastapi import FastAPI
-import redis
+import redis.asyncio as aioredis
 import os
 
 app = FastAPI()
 
+# Shared pool so requests reuse open sockets instead of reconnecting each time
+redis_host = os.getenv("REDIS_HOST", "localhost")
+redis_pool = aioredis.ConnectionPool.from_url(
+    f"redis://{redis_host}:6379", max_connections=32, decode_responses=True
+)
+
 @app.get("/")
 def read_root():
     return {"message": "Welcome to Construction Legal AI Backend"}
@@ -13,11 +19,10 @@ def health_check():
     return {"status": "healthy"}
 
 @app.get("/redis-test")
-def redis_test():
+async def redis_test():
     try:
-        redis_host = os.getenv("REDIS_HOST", "localhost")
-        r = redis.Redis(host=redis_host, port=6379, decode_responses=True)
-        r.ping()
+        r = aioredis.Redis(connection_pool=redis_pool)
+        await r.ping()
         return {"status": "connected", "host": redis_host}
     except Exception as e:
         return {"status": "error", "message": str(e)}
@@ -2,6 +2,10 @@
 FIDIC Red Book PDF Parser
 Extracts PDF content to markdown format optimized for RAG applications.
 
+Pages are extracted in parallel: each worker process opens its own handle
+on the PDF and converts a disjoint page range, and the results are written
+to the output file in page order.
+
 Usage:
     uv run python src/pdf_parser.py
 
@@ -9,9 +13,12 @@ Output:
     FIDIC-Red-Book-1999.md - Structured markdown with page headers
 """
 
-import pymupdf
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+import pymupdf
+
 # Get the project root directory (parent of src/)
 project_root = Path(__file__).parent.parent
 
@@ -19,44 +26,90 @@ project_root = Path(__file__).parent.parent
 input_pdf = project_root / "FIDIC-Red-Book-1999.pdf"
 output_md = project_root / "FIDIC-Red-Book-1999.md"
 
-# Validate input file exists
-if not input_pdf.exists():
-    raise FileNotFoundError(f"PDF not found: {input_pdf}")
+# Output buffer size; pages are small, so batch them into ~1 MB writes
+WRITE_BUFFER_SIZE = 1 << 20
+
+
+def extract_range(args):
+    """Extract pages [start, end) of a PDF as markdown.
+
+    Runs inside a worker process, so the document is opened here rather
+    than passed in (PyMuPDF handles cannot be shared across processes).
+
+    Returns a list of (page_num, markdown) tuples, page_num starting at 1.
+    The markdown is UTF-8 encoded bytes, ready to write to the output file.
+    """
+    pdf_path, start, end = args
+    pages = []
+
+    with pymupdf.open(pdf_path) as doc:
+        for index in range(start, end):
+            # Get plain text from page
+            plain_text = doc[index].get_text()
+
+            # Create markdown with page header and separator
+            page_num = index + 1
+            markdown = f"# Page {page_num}\n\n{plain_text}\n\n---\n\n"
+            pages.append(
+                (page_num, markdown.encode('utf-8', errors='replace'))
+            )
+
+    return pages
+
+
+def split_pages(total_pages, workers):
+    """Split range(total_pages) into at most `workers` contiguous chunks."""
+    workers = max(1, min(workers, total_pages))
+    size, extra = divmod(total_pages, workers)
+    chunks = []
+    start = 0
+    for i in range(workers):
+        end = start + size + (1 if i < extra else 0)
+        chunks.append((start, end))
+        start = end
+    return chunks
 
-print(f"📄 Converting PDF: {input_pdf.name}")
-print(f"📝 Output: {output_md.name}\n")
 
-# Open the PDF document
-doc = pymupdf.open(input_pdf)
-total_pages = len(doc)
+def main():
+    # Validate input file exists
+    if not input_pdf.exists():
+        raise FileNotFoundError(f"PDF not found: {input_pdf}")
 
-# Extract text and format as markdown
-markdown_content = []
+    print(f"📄 Converting PDF: {input_pdf.name}")
+    print(f"📝 Output: {output_md.name}\n")
 
-for page_num, page in enumerate(doc, start=1):
-    print(f"Processing page {page_num}/{total_pages}...", end='\r')
+    # Only the page count is needed up front; workers open their own handles
+    with pymupdf.open(input_pdf) as doc:
+        total_pages = len(doc)
 
-    # Get plain text from page
-    plain_text = page.get_text()
+    chunks = split_pages(total_pages, os.cpu_count() or 1)
+    tasks = [(str(input_pdf), start, end) for start, end in chunks]
+    done = 0
+    written = 0
 
-    # Create markdown with page header and separator
-    markdown_content.append(
-        f"# Page {page_num}\n\n{plain_text}\n\n---\n\n"
-    )
+    # Extract text and format as markdown. map() yields chunks in submission
+    # order, so each one can be written as soon as it arrives.
+    with ProcessPoolExecutor(max_workers=len(tasks)) as pool, \
+            open(output_md, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+        for pages in pool.map(extract_range, tasks):
+            for _, markdown in pages:
+                f.write(markdown)
+                written += len(markdown)
+            done += len(pages)
+            print(f"Processing page {done}/{total_pages}...", end='\r')
 
-# Save markdown output
-with open(output_md, 'w', encoding='utf-8') as f:
-    f.write(''.join(markdown_content))
+    # Print summary
+    print(f"\n\n✅ Conversion complete!")
+    print(f"📊 Statistics:")
+    print(f"   - Total pages: {total_pages}")
+    print(f"   - Workers: {len(tasks)}")
+    print(f"   - Output size: {written / 1024:.1f} KB")
+    print(f"   - File location: {output_md}")
+    print(f"\n💡 Next steps:")
+    print(f"   1. Review the markdown file")
+    print(f"   2. Implement RAG chunking (see README.md)")
+    print(f"   3. Generate embeddings for vector database")
 
-doc.close()
 
-# Print summary
-print(f"\n\n✅ Conversion complete!")
-print(f"📊 Statistics:")
-print(f"   - Total pages: {total_pages}")
-print(f"   - Output size: {output_md.stat().st_size / 1024:.1f} KB")
-print(f"   - File location: {output_md}")
-print(f"\n💡 Next steps:")
-print(f"   1. Review the markdown file")
-print(f"   2. Implement RAG chunking (see README.md)")
-print(f"   3. Generate embeddings for vector database")
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,23 @@
 import streamlit as st
 import requests
+from requests.adapters import HTTPAdapter
+import os
+
+BACKEND_URL = os.getenv("BACKEND_URL", "http://backend:8000")
 
 st.set_page_config(page_title="Construction Legal AI", page_icon="🏗️")
 
+
+@st.cache_resource
+def get_session():
+    # One pooled keep-alive session shared across reruns and users
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=2)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
 st.title("🏗️ Construction Legal AI (CLA)")
 st.caption("Contract-Centric Conflict Resolution Engine")
 
@@ -11,7 +26,7 @@ st.markdown("---")
 # Sidebar
 with st.sidebar:
     st.header("Settings")
-    st.info("Connected to Backend: http://backend:8000")
+    st.info(f"Connected to Backend: {BACKEND_URL}")
 
 # Main Content
 st.header("Ask a Legal Question")
@@ -21,7 +36,7 @@ if st.button("Submit Query"):
     if query:
         st.write("Processing...")
         # Placeholder for API call
-        # response = requests.post("http://backend:8000/query", json={"query": query})
+        # response = get_session().post(f"{BACKEND_URL}/query", json={"query": query}, timeout=5)
         # st.write(response.json())
         st.success("This is a placeholder response. Backend connection will be implemented soon.")
     else: